@@ -47,7 +47,7 @@ logging.getLogger("petnetizen_feeder").setLevel(logging.DEBUG)
 
 
 def _fmt(data: bytearray) -> str:
-    return " ".join(f"{b:02X}" for b in data)
+    return data.hex(" ").upper()
 
 
 # ── result tracker ────────────────────────────────────────────────────────────
@@ -110,7 +110,7 @@ async def main() -> int:
     if positional:
         raw = positional[0].strip().upper().replace("-", ":")
         if len(raw) == 12 and ":" not in raw:
-            raw = ":".join(raw[i : i + 2] for i in range(0, 12, 2))
+            raw = f"{raw[0:2]}:{raw[2:4]}:{raw[4:6]}:{raw[6:8]}:{raw[8:10]}:{raw[10:12]}"
         address = raw
 
     # ── 1. Discovery ─────────────────────────────────────────────────────────
@@ -118,8 +118,8 @@ async def main() -> int:
     if address:
         s.ok(f"address supplied: {address}")
     else:
-        print("  scanning 10 s …")
-        feeders = await discover_feeders(timeout=10.0)
+        print("  scanning up to 10 s …")
+        feeders = await discover_feeders(timeout=10.0, limit=1)
         if not feeders:
             s.fail("no feeders found — pass MAC as argument")
             return 1
@@ -145,14 +145,15 @@ async def main() -> int:
     # ── 4. Send verification code ─────────────────────────────────────────────
     s = stage(f"Verification code ({DEFAULT_VERIFICATION_CODE})")
     t0 = time.monotonic()
-    before = len(proto.received_data)
+    # received_data is a bounded deque: clear it so it holds only new entries
+    proto.received_data.clear()
     await proto.send_verification_code(DEFAULT_VERIFICATION_CODE)
-    after_count = len(proto.received_data) - before
+    after_count = len(proto.received_data)
     elapsed = time.monotonic() - t0
     # Look for CMD_SET_FAMILY_ID (06) response
     verif_ok = any(
-        len(d) >= 2 and f"{d[1]:02X}" == "06"
-        for d in proto.received_data[before:]
+        len(d) >= 2 and d[1] == CMD_SET_FAMILY_ID
+        for d in proto.received_data
     )
     note = f"{after_count} notification(s) received"
     if verif_ok:
@@ -163,7 +164,7 @@ async def main() -> int:
 
     # ── 5. Enable notifications ───────────────────────────────────────────────
     s = stage("start_notify (enable notifications)")
-    before = len(proto.received_data)
+    proto.received_data.clear()
     ok = await proto.enable_notifications()
     if not ok:
         s.fail("start_notify failed — this is the error seen in HA logs via ESP32 proxy")
@@ -171,35 +172,21 @@ async def main() -> int:
         print("  → If only HA/proxy fails, the proxy's NimBLE stack is causing HCI error 19.")
         await proto.disconnect()
         return 1
-    after_count = len(proto.received_data) - before
+    after_count = len(proto.received_data)
     s.ok(f"notifications enabled  (got {after_count} unsolicited notifications)")
 
     # ── 6. Device info ────────────────────────────────────────────────────────
     s = stage("Device info (CMD 0x00)")
-    before = len(proto.received_data)
-    cmd = proto.encode_command(CMD_QUERY_NAME_VERSION, length=0)
-    print(f"  >> {_fmt(cmd)}")
-    await proto.client.write_gatt_char(proto.write_uuid, cmd, response=False)
-    await asyncio.sleep(2.0)
-    info_notifications = [
-        proto.decode_notification(d)
-        for d in proto.received_data[before:]
-        if len(d) >= 2 and f"{d[1]:02X}" == "00"
-    ]
-    if info_notifications:
-        n = info_notifications[0]
+    print(f"  >> {_fmt(proto.encode_command(CMD_QUERY_NAME_VERSION, length=0))}")
+    n = await proto.query_name_version(timeout=2.0)
+    if n:
         s.ok(f"name={n.get('device_name', '?')!r}  version={n.get('device_version', '?')!r}")
     else:
         s.fail("no CMD_00 response within 2 s")
 
     # ── 7. Fault status ───────────────────────────────────────────────────────
     s = stage("Fault status (CMD 0x0A)")
-    before = len(proto.received_data)
-    await proto.query_fault()
-    resp = next(
-        (proto.decode_notification(d) for d in proto.received_data[before:] if len(d) >= 2 and f"{d[1]:02X}" == "0A"),
-        None,
-    )
+    resp = await proto.query_fault()
     if resp:
         s.ok(f"fault_code={resp.get('fault_code')}")
     else:
@@ -207,12 +194,7 @@ async def main() -> int:
 
     # ── 8. Feeding status ─────────────────────────────────────────────────────
     s = stage("Feeding status (CMD 0x09)")
-    before = len(proto.received_data)
-    await proto.query_feeding_status()
-    resp = next(
-        (proto.decode_notification(d) for d in proto.received_data[before:] if len(d) >= 2 and f"{d[1]:02X}" == "09"),
-        None,
-    )
+    resp = await proto.query_feeding_status()
     if resp:
         s.ok(f"status={resp.get('feeding_status_text')}")
     else:
@@ -220,12 +202,7 @@ async def main() -> int:
 
     # ── 9. Child lock ─────────────────────────────────────────────────────────
     s = stage("Child lock (CMD 0x0D)")
-    before = len(proto.received_data)
-    await proto.query_child_lock()
-    resp = next(
-        (proto.decode_notification(d) for d in proto.received_data[before:] if len(d) >= 2 and f"{d[1]:02X}" == "0D"),
-        None,
-    )
+    resp = await proto.query_child_lock()
     if resp:
         s.ok(f"child_lock={resp.get('child_lock_text')}")
     else:
@@ -233,12 +210,7 @@ async def main() -> int:
 
     # ── 10. Prompt sound ─────────────────────────────────────────────────────
     s = stage("Prompt sound (CMD 0x12)")
-    before = len(proto.received_data)
-    await proto.query_reminder_tone()
-    resp = next(
-        (proto.decode_notification(d) for d in proto.received_data[before:] if len(d) >= 2 and f"{d[1]:02X}" == "12"),
-        None,
-    )
+    resp = await proto.query_reminder_tone()
     if resp:
         s.ok(f"prompt_sound={resp.get('prompt_sound_text')}")
     else:
@@ -246,15 +218,15 @@ async def main() -> int:
 
     # ── 11. Schedule query ────────────────────────────────────────────────────
     s = stage("Schedule query (CMD 0x11)")
-    before = len(proto.received_data)
+    proto.received_data.clear()
     cmd = proto.encode_command(CMD_QUERY_FEEDER_PLAN, length=0)
     print(f"  >> {_fmt(cmd)}")
     await proto.client.write_gatt_char(proto.write_uuid, cmd, response=False)
     await asyncio.sleep(4.0)
     plan_notifications = [
         proto.decode_notification(d)
-        for d in proto.received_data[before:]
-        if len(d) >= 2 and f"{d[1]:02X}" == "11"
+        for d in proto.received_data
+        if len(d) >= 2 and d[1] == CMD_QUERY_FEEDER_PLAN
     ]
     if plan_notifications:
         slots = plan_notifications[0].get("feed_plan_slots") or []
@@ -15,11 +15,22 @@ integration first, or this script will get "Connect failed."
 """
 
 import asyncio
+import struct
 import sys
 
 
 def format_hex(data: bytearray) -> str:
-    return " ".join(f"{b:02X}" for b in data)
+    return data.hex(" ").upper()
+
+
+# One slot: week bitmask, hour, minute, portions, enabled
+SLOT_STRUCT = struct.Struct("5B")
+
+# Weekday names for every possible week bitmask value (bit 0 = Sunday ... bit 6 = Saturday)
+WEEK_BITS = [(1, "sun"), (2, "mon"), (4, "tue"), (8, "wed"), (16, "thu"), (32, "fri"), (64, "sat")]
+WEEK_TO_DAYS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(d for bit, d in WEEK_BITS if v & bit) for v in range(128)
+)
 
 
 def decode_command_11_payload(data_section: bytearray) -> list[dict]:
@@ -31,18 +42,16 @@ def decode_command_11_payload(data_section: bytearray) -> list[dict]:
         n = data_section[0]
         if len(data_section) >= 1 + 5 * n:
             offset = 1
-    # Parse 5-byte slots
-    week_bits = [(1, "sun"), (2, "mon"), (4, "tue"), (8, "wed"), (16, "thu"), (32, "fri"), (64, "sat")]
-    while offset + 5 <= len(data_section):
-        week_val, hour, minute, portions, enabled = data_section[offset : offset + 5]
-        weekdays = [d for bit, d in week_bits if week_val & bit]
+    # Parse 5-byte slots (any trailing partial slot is ignored)
+    body = memoryview(data_section)[offset:]
+    body = body[: len(body) - len(body) % SLOT_STRUCT.size]
+    for week_val, hour, minute, portions, enabled in SLOT_STRUCT.iter_unpack(body):
         slots.append({
-            "weekdays": weekdays,
+            "weekdays": list(WEEK_TO_DAYS[week_val & 0x7F]),
             "time": f"{hour:02d}:{minute:02d}",
             "portions": portions,
             "enabled": bool(enabled),
         })
-        offset += 5
     return slots
 
 
@@ -60,11 +69,11 @@ async def main() -> None:
     if len(sys.argv) > 1:
         address = sys.argv[1].strip().upper().replace("-", ":")
         if len(address) == 12 and ":" not in address:
-            address = ":".join(address[i : i + 2] for i in range(0, 12, 2))
+            address = f"{address[0:2]}:{address[2:4]}:{address[4:6]}:{address[6:8]}:{address[8:10]}:{address[10:12]}"
         print(f"MAC: {address}")
     else:
-        print("Scanning 10s...")
-        feeders = await discover_feeders(timeout=10.0)
+        print("Scanning up to 10s...")
+        feeders = await discover_feeders(timeout=10.0, limit=1)
         if not feeders:
             print("No feeders found. Pass MAC:  uv run python examples/get_schedule_poc.py E6:C0:07:09:A3:D3")
             return
@@ -81,17 +90,18 @@ async def main() -> None:
         await protocol.send_verification_code(DEFAULT_VERIFICATION_CODE)
         await asyncio.sleep(1.0)
 
-        # Clear previous notifications, send query, wait
-        before = len(protocol.received_data)
+        # Clear previous notifications (received_data is a bounded deque, so
+        # its length cannot mark where new entries start), send query, wait
+        protocol.received_data.clear()
         cmd = protocol.encode_command(CMD_QUERY_FEEDER_PLAN, length=0)
         print(f"\n>>> Send QUERY_FEEDER_PLAN: {format_hex(cmd)}")
         await protocol.client.write_gatt_char(protocol.write_uuid, cmd, response=False)
         await asyncio.sleep(4.0)
 
-        new_count = len(protocol.received_data) - before
+        new_count = len(protocol.received_data)
         print(f"\n<<< Received {new_count} notification(s) after query\n")
 
-        for i, data in enumerate(protocol.received_data[before:]):
+        for i, data in enumerate(protocol.received_data):
             raw = format_hex(data)
             print(f"--- Notification #{i+1} (len={len(data)}) ---")
             print(f"  Raw: {raw}")
@@ -110,7 +120,7 @@ async def main() -> None:
             print(f"  Command: 0x{cmd_hex}  length_byte={length_byte}  payload_len={len(data_section)}")
             print(f"  Payload hex: {data_hex}")
 
-            if cmd_hex == "11":
+            if cmd_byte == CMD_QUERY_FEEDER_PLAN:
                 print("  ^^^ QUERY_FEEDER_PLAN response ^^^")
                 slots = decode_command_11_payload(data_section)
                 if slots:
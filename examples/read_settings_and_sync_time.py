@@ -13,9 +13,11 @@ With a MAC argument, discovery is skipped and the script connects directly
 import asyncio
 import sys
 from petnetizen_feeder import discover_feeders, FeederDevice
+from petnetizen_feeder.protocol import enable_eager_tasks
 
 
 async def main() -> None:
+    enable_eager_tasks()
     address: str | None = None
     name = ""
     device_type = "standard"
@@ -23,11 +25,11 @@ async def main() -> None:
     if len(sys.argv) > 1:
         address = sys.argv[1].strip().upper().replace("-", ":")
         if len(address) == 12 and ":" not in address:
-            address = ":".join(address[i : i + 2] for i in range(0, 12, 2))
+            address = f"{address[0:2]}:{address[2:4]}:{address[4:6]}:{address[6:8]}:{address[8:10]}:{address[10:12]}"
         print(f"Using MAC: {address!r} (no discovery)")
     else:
-        print("Scanning for feeders (10s)...")
-        feeders = await discover_feeders(timeout=10.0)
+        print("Scanning for feeders (up to 10s)...")
+        feeders = await discover_feeders(timeout=10.0, limit=1)
         if not feeders:
             print("No feeders found. Ensure Bluetooth is on and a feeder is in range.")
             print("Or pass a MAC:  uv run python examples/read_settings_and_sync_time.py E6:C0:07:09:A3:D3")
@@ -43,12 +45,14 @@ async def main() -> None:
         return
 
     try:
-        # Read device info (name + firmware version)
-        info = await feeder.get_device_info()
+        # Read device info (name + firmware version) and schedule together: each
+        # response is routed to its own waiter, so the two queries can overlap.
+        # (The schedule may be empty if not yet parsed from the response.)
+        info, schedules = await asyncio.gather(
+            feeder.get_device_info(), feeder.query_schedule()
+        )
         print(f"Device: {info.get('device_name', '')!r}  firmware={info.get('device_version', '')!r}")
 
-        # Read schedule (may be empty if not yet parsed from response)
-        schedules = await feeder.query_schedule()
         print(f"Schedule entries: {len(schedules)}")
         for i, s in enumerate(schedules):
             print(f"  [{i}] {s}")
@@ -35,14 +35,30 @@ Example usage:
     asyncio.run(main())
 """
 
-from .feeder import (
-    ConnectionFactory,
-    FeederDevice,
-    FeedSchedule,
-    Weekday,
-    discover_feeders,
+from typing import TYPE_CHECKING
+
+from .schedule import FeedSchedule, Weekday
+
+if TYPE_CHECKING:
+    from .feeder import ConnectionFactory, FeederDevice, discover_feeders
+
+# Names that need bleak are imported on first access (PEP 562) so that using
+# only the schedule helpers does not pay for importing the BLE stack.
+_LAZY_FEEDER_NAMES = frozenset(
+    {"ConnectionFactory", "FeederDevice", "discover_feeders"}
 )
 
+
+def __getattr__(name: str):
+    if name in _LAZY_FEEDER_NAMES:
+        from . import feeder
+
+        value = getattr(feeder, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "0.5.6"
 __all__ = [
     "ConnectionFactory",
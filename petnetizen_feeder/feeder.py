@@ -13,80 +13,21 @@ from .protocol import (
     FeederBLEProtocol,
     discover_feeders,  # noqa: F401 (re-exported via __init__)
     CMD_FEEDING,
+    CMD_MANUAL_FEED_RESULT,
     CMD_SET_FEEDER_PLAN,
     CMD_CHILD_LOCK,
+    CMD_FAULT,
+    CMD_FEEDING_STATUS,
     CMD_REMINDER_TONE,
     CMD_QUERY_FEEDER_PLAN,
     DEFAULT_VERIFICATION_CODE,
 )
+from .schedule import WEEKDAY_BITMASK, FeedSchedule, Weekday  # noqa: F401 (re-exported)
 
 _LOGGER = logging.getLogger(__name__)
 
 ConnectionFactory = Callable[[], Awaitable[Any]]
 
-# Weekday bitmask values (from FeedInfo.Companion.getWeekValue)
-WEEKDAY_BITMASK = {
-    "sun": 1,
-    "mon": 2,
-    "tue": 4,
-    "wed": 8,
-    "thu": 16,
-    "fri": 32,
-    "sat": 64,
-}
-
-
-class Weekday:
-    """Weekday constants for schedule"""
-
-    SUNDAY = "sun"
-    MONDAY = "mon"
-    TUESDAY = "tue"
-    WEDNESDAY = "wed"
-    THURSDAY = "thu"
-    FRIDAY = "fri"
-    SATURDAY = "sat"
-
-    ALL_DAYS = ["sun", "mon", "tue", "wed", "thu", "fri", "sat"]
-    WEEKDAYS = ["mon", "tue", "wed", "thu", "fri"]
-    WEEKEND = ["sat", "sun"]
-
-
-class FeedSchedule:
-    """Represents a single feed schedule entry"""
-
-    def __init__(
-        self, weekdays: List[str], time: str, portions: int, enabled: bool = True
-    ):
-        """
-        Args:
-            weekdays: List of weekday names (e.g., ["mon", "wed", "fri"])
-            time: Time in HH:MM format (e.g., "08:00")
-            portions: Number of portions to feed (1-15)
-            enabled: Whether this schedule is enabled
-        """
-        self.weekdays = weekdays
-        self.time = time
-        self.portions = portions
-        self.enabled = enabled
-
-    def to_bytes(self) -> bytes:
-        """Convert schedule to protocol format"""
-        # Calculate week bitmask
-        week_value = 0
-        for day in self.weekdays:
-            day_lower = day.lower()
-            if day_lower in WEEKDAY_BITMASK:
-                week_value |= WEEKDAY_BITMASK[day_lower]
-
-        # Parse time
-        hour, minute = map(int, self.time.split(":"))
-
-        # Format: week(1 hex) + hour(1 hex) + minute(1 hex) + count(1 hex) + enabled(1 hex)
-        return bytes(
-            [week_value, hour, minute, self.portions, 1 if self.enabled else 0]
-        )
-
 
 class FeederDevice:
     """
@@ -325,7 +266,7 @@ class FeederDevice:
                 self.address,
             )
         finally:
-            self._protocol.client = None
+            self._protocol.detach_client()
         await asyncio.sleep(2.0)
 
     async def feed(self, portions: int = 1, *, fast: bool = True) -> bool:
@@ -352,44 +293,29 @@ class FeederDevice:
         _LOGGER.debug("Feeding %d portion(s) (fast=%s)", portions, fast)
 
         if not fast:
-            await self._protocol.query_fault()
-            await asyncio.sleep(0.5)
-            await self._protocol.query_child_lock()
-            await asyncio.sleep(0.5)
-            await self._protocol.query_feeding_status()
-            await asyncio.sleep(0.5)
+            # Independent queries: pipeline the writes and overlap the replies.
+            await self._protocol.query_batch(
+                (CMD_FAULT, CMD_CHILD_LOCK, CMD_FEEDING_STATUS), timeout=1.0
+            )
 
         command = self._protocol.encode_command(
-            CMD_FEEDING, length=1, action_hex=f"{portions:02X}"
+            CMD_FEEDING, length=1, action=bytes((portions,))
         )
 
-        self._protocol.clear_notifications()
-        notification_count_before = len(self._protocol.received_data)
+        # Register for the ACK (08) and the completion record (0C) before the
+        # write so neither can be missed; the notification handler resolves them.
+        ack = self._protocol.expect_notification(CMD_FEEDING)
+        completed = self._protocol.expect_notification(CMD_MANUAL_FEED_RESULT)
 
         try:
-            await self._protocol.client.write_gatt_char(
-                self._protocol.write_uuid, command, response=False
-            )
+            await self._protocol.send_frame(command)
             _LOGGER.debug("Feed command sent, waiting for response")
 
-            feed_triggered = False
-            for _ in range(40):  # Wait up to 10 seconds
-                await asyncio.sleep(0.25)
-                if len(self._protocol.received_data) > notification_count_before:
-                    new_notifications = self._protocol.received_data[
-                        notification_count_before:
-                    ]
-                    for data in new_notifications:
-                        decoded = self._protocol.decode_notification(data)
-                        cmd = decoded.get("command", "")
-
-                        if cmd == "08":
-                            feed_triggered = True
-                            _LOGGER.debug("Feed acknowledged by device")
-                        elif cmd == "0C":
-                            _LOGGER.info("Feed completed (%d portions)", portions)
-                            return True
+            if await self._protocol.wait_for_notification(completed, 10.0) is not None:
+                _LOGGER.info("Feed completed (%d portions)", portions)
+                return True
 
+            feed_triggered = ack.done() and not ack.cancelled()
             if feed_triggered:
                 _LOGGER.info(
                     "Feed triggered but no completion result within 10s (%d portions)",
@@ -403,6 +329,9 @@ class FeederDevice:
             return feed_triggered
         except Exception as e:
             raise RuntimeError(f"Failed to send feed command: {e}") from e
+        finally:
+            ack.cancel()
+            completed.cancel()
 
     async def set_schedule(self, schedules: List[FeedSchedule]) -> bool:
         """
@@ -425,25 +354,26 @@ class FeederDevice:
 
         _LOGGER.debug("Setting schedule with %d slot(s)", len(schedules))
 
-        schedule_data = bytearray()
-        for schedule in schedules:
-            schedule_data.extend(schedule.to_bytes())
+        schedule_data = b"".join(schedule.to_bytes() for schedule in schedules)
 
         command = self._protocol.encode_command(
             CMD_SET_FEEDER_PLAN,
             length=len(schedule_data),
-            action_hex=schedule_data.hex().upper(),
+            action=schedule_data,
         )
 
+        # The device echoes setter commands once applied; return as soon as
+        # that arrives instead of always sleeping a full second.
+        ack = self._protocol.expect_notification(CMD_SET_FEEDER_PLAN)
         try:
-            await self._protocol.client.write_gatt_char(
-                self._protocol.write_uuid, command, response=False
-            )
-            await asyncio.sleep(1)
+            await self._protocol.send_frame(command)
+            await self._protocol.wait_for_notification(ack, 1.0)
             _LOGGER.info("Schedule set (%d slots)", len(schedules))
             return True
         except Exception as e:
             raise RuntimeError(f"Failed to set schedule: {e}") from e
+        finally:
+            ack.cancel()
 
     async def set_child_lock(self, locked: bool) -> bool:
         """
@@ -466,20 +396,19 @@ class FeederDevice:
 
         _LOGGER.debug("Setting child lock to %s", locked)
 
-        value = "01" if locked else "00"
-        command = self._protocol.encode_command(
-            CMD_CHILD_LOCK, length=1, action_hex=value
-        )
+        value = b"\x01" if locked else b"\x00"
+        command = self._protocol.encode_command(CMD_CHILD_LOCK, length=1, action=value)
 
+        ack = self._protocol.expect_notification(CMD_CHILD_LOCK)
         try:
-            await self._protocol.client.write_gatt_char(
-                self._protocol.write_uuid, command, response=False
-            )
-            await asyncio.sleep(1)
+            await self._protocol.send_frame(command)
+            await self._protocol.wait_for_notification(ack, 1.0)
             _LOGGER.info("Child lock set to %s", "locked" if locked else "unlocked")
             return True
         except Exception as e:
             raise RuntimeError(f"Failed to set child lock: {e}") from e
+        finally:
+            ack.cancel()
 
     async def set_sound(self, enabled: bool) -> bool:
         """
@@ -502,20 +431,21 @@ class FeederDevice:
 
         _LOGGER.debug("Setting sound to %s", enabled)
 
-        value = "01" if enabled else "00"
+        value = b"\x01" if enabled else b"\x00"
         command = self._protocol.encode_command(
-            CMD_REMINDER_TONE, length=1, action_hex=value
+            CMD_REMINDER_TONE, length=1, action=value
         )
 
+        ack = self._protocol.expect_notification(CMD_REMINDER_TONE)
         try:
-            await self._protocol.client.write_gatt_char(
-                self._protocol.write_uuid, command, response=False
-            )
-            await asyncio.sleep(1)
+            await self._protocol.send_frame(command)
+            await self._protocol.wait_for_notification(ack, 1.0)
             _LOGGER.info("Sound set to %s", "on" if enabled else "off")
             return True
         except Exception as e:
             raise RuntimeError(f"Failed to set sound: {e}") from e
+        finally:
+            ack.cancel()
 
     async def query_schedule(self) -> List[Dict]:
         """
@@ -536,44 +466,29 @@ class FeederDevice:
         _LOGGER.debug("Querying schedule")
         command = self._protocol.encode_command(CMD_QUERY_FEEDER_PLAN, length=0)
 
-        self._protocol.clear_notifications()
-        notification_count_before = len(self._protocol.received_data)
+        response = self._protocol.expect_notification(CMD_QUERY_FEEDER_PLAN)
 
         try:
-            await self._protocol.client.write_gatt_char(
-                self._protocol.write_uuid, command, response=False
-            )
-            await asyncio.sleep(4.0)
-
-            new_count = len(self._protocol.received_data) - notification_count_before
-            if new_count > 0:
-                new_notifications = self._protocol.received_data[
-                    notification_count_before:
-                ]
+            await self._protocol.send_frame(command)
+            decoded = await self._protocol.wait_for_notification(response, 4.0)
+            if decoded is None:
+                _LOGGER.warning("No response to schedule query within 4s")
+                return []
+            slots = decoded.get("feed_plan_slots") or []
+            if slots:
+                _LOGGER.debug("Schedule received: %d slot(s)", len(slots))
+                return slots
+            if "data_hex" in decoded:
                 _LOGGER.debug(
-                    "query_schedule: got %d new notification(s)", len(new_notifications)
+                    "QUERY_FEEDER_PLAN response data_hex=%s len=%s",
+                    decoded.get("data_hex"),
+                    len(decoded["raw_bytes"]),
                 )
-                for data in new_notifications:
-                    decoded = self._protocol.decode_notification(data)
-                    cmd = decoded.get("command")
-                    if cmd == "11":
-                        slots = decoded.get("feed_plan_slots") or []
-                        if slots:
-                            _LOGGER.debug("Schedule received: %d slot(s)", len(slots))
-                            return slots
-                        if "data_hex" in decoded:
-                            _LOGGER.debug(
-                                "QUERY_FEEDER_PLAN response data_hex=%s len=%s",
-                                decoded.get("data_hex"),
-                                len(data) if hasattr(data, "__len__") else None,
-                            )
-                    elif cmd and "error" not in decoded:
-                        _LOGGER.debug("query_schedule saw notification cmd=%s", cmd)
-            else:
-                _LOGGER.warning("No response to schedule query within 4s")
             return []
         except Exception as e:
             raise RuntimeError(f"Failed to query schedule: {e}") from e
+        finally:
+            response.cancel()
 
     async def get_device_info(self) -> Dict:
         """
@@ -587,44 +502,27 @@ class FeederDevice:
         if not await self.ensure_connected():
             raise RuntimeError("Connection lost. Please reconnect.")
         _LOGGER.debug("Querying device info")
-        self._protocol.clear_notifications()
-        before = len(self._protocol.received_data)
-        await self._protocol.query_name_version()
-        await asyncio.sleep(2)
+        decoded = await self._protocol.query_name_version(timeout=2.0)
         result: Dict = {"device_name": "", "device_version": ""}
-        for data in self._protocol.received_data[before:]:
-            decoded = self._protocol.decode_notification(data)
-            if decoded.get("command") == "00":
-                result["device_name"] = decoded.get("device_name", "") or ""
-                result["device_version"] = decoded.get("device_version", "") or ""
-                _LOGGER.debug(
-                    "Device info: name=%s version=%s",
-                    result["device_name"],
-                    result["device_version"],
-                )
-                break
-        else:
+        if decoded is None:
             _LOGGER.warning("No device info response received within 2s")
+            return result
+        result["device_name"] = decoded.get("device_name", "") or ""
+        result["device_version"] = decoded.get("device_version", "") or ""
+        _LOGGER.debug(
+            "Device info: name=%s version=%s",
+            result["device_name"],
+            result["device_version"],
+        )
         return result
 
-    async def _query_state(
-        self, query_func, command_code, timeout: float = 1.5
-    ) -> Optional[Dict]:
-        """Send a query command and return the first matching decoded notification, or None."""
+    async def _query_state(self, query_func, timeout: float = 1.5) -> Optional[Dict]:
+        """Send a query command and return its decoded reply, or None if none arrived."""
         if not self._connected:
             raise RuntimeError("Not connected to device. Call connect() first.")
         if not await self.ensure_connected():
             raise RuntimeError("Connection lost. Please reconnect.")
-        self._protocol.clear_notifications()
-        before = len(self._protocol.received_data)
-        await query_func()
-        await asyncio.sleep(timeout)
-        codes = (command_code,) if isinstance(command_code, str) else command_code
-        for data in self._protocol.received_data[before:]:
-            decoded = self._protocol.decode_notification(data)
-            if decoded.get("command") in codes:
-                return decoded
-        return None
+        return await query_func(timeout=timeout)
 
     async def _set_feature(self, log_msg: str, coro) -> bool:
         """Connection-guard wrapper for protocol set commands."""
@@ -643,7 +541,7 @@ class FeederDevice:
         Returns:
             True if locked, False if unlocked, or None if query failed or no response.
         """
-        decoded = await self._query_state(self._protocol.query_child_lock, "0D")
+        decoded = await self._query_state(self._protocol.query_child_lock)
         if decoded is None or "child_lock" not in decoded:
             _LOGGER.debug("No child lock response received within 1.5s")
             return None
@@ -658,7 +556,7 @@ class FeederDevice:
         Returns:
             True if sound is on, False if off, or None if query failed or no response.
         """
-        decoded = await self._query_state(self._protocol.query_reminder_tone, "12")
+        decoded = await self._query_state(self._protocol.query_reminder_tone)
         if decoded is None or "prompt_sound" not in decoded:
             _LOGGER.debug("No prompt sound response received within 1.5s")
             return None
@@ -680,7 +578,7 @@ class FeederDevice:
 
     async def get_fault_status(self) -> Optional[int]:
         """Query device fault status. Returns fault code int (0 = no fault), or None."""
-        decoded = await self._query_state(self._protocol.query_fault, "0A")
+        decoded = await self._query_state(self._protocol.query_fault)
         if decoded is None or "fault_code" not in decoded:
             _LOGGER.debug("No fault status response received within 1.5s")
             return None
@@ -689,7 +587,7 @@ class FeederDevice:
 
     async def get_feeding_status(self) -> Optional[str]:
         """Query current feeding status. Returns 'idle', 'feeding', 'error', or None."""
-        decoded = await self._query_state(self._protocol.query_feeding_status, "09")
+        decoded = await self._query_state(self._protocol.query_feeding_status)
         if decoded is None or "feeding_status_text" not in decoded:
             _LOGGER.debug("No feeding status response received within 1.5s")
             return None
@@ -729,9 +627,7 @@ class FeederDevice:
             Dict with keys: enabled (bool), start_time (str HH:MM), end_time (str HH:MM),
             or None if no response.
         """
-        decoded = await self._query_state(
-            self._protocol.query_do_not_disturb, ("17", "18")
-        )
+        decoded = await self._query_state(self._protocol.query_do_not_disturb)
         if decoded is None or "do_not_disturb" not in decoded:
             # Some feeder firmwares don't implement DND (cmd 0x17/0x18) — log at
             # DEBUG only, since this fires every poll and is not actionable.
@@ -769,6 +665,4 @@ class FeederDevice:
     @property
     def is_connected(self) -> bool:
         """Check if device is connected"""
-        return self._connected and (
-            self._protocol.client is not None and self._protocol.client.is_connected
-        )
+        return self._connected and self._protocol.is_connected
@@ -6,10 +6,17 @@ This module handles the Tuya BLE protocol encoding/decoding and device communica
 
 import asyncio
 import logging
+import struct
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Callable, Deque, Dict, Iterable, Optional, List, Tuple, Union
 from bleak import BleakClient, BleakScanner
 from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from .schedule import _SLOT_STRUCT, WEEKDAY_BITMASK
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,30 +35,41 @@ ALI_FEEDER_NOTIFY_UUID = "0000ff02-0000-1000-8000-00805f9b34fb"
 
 DEFAULT_VERIFICATION_CODE = "00000000"
 
-# Command IDs
-CMD_QUERY_NAME_VERSION = "00"
-CMD_SET_NAME = "01"
-CMD_RESTORE_FACTORY = "02"
-CMD_HEARTBEAT = "03"
-CMD_QUERY_MAC = "04"
-CMD_SYNC_TIME = "05"
-CMD_SET_FAMILY_ID = "06"
-CMD_SET_FEEDER_PLAN = "07"
-CMD_FEEDING = "08"
-CMD_FEEDING_STATUS = "09"
-CMD_FAULT = "0A"
-CMD_PLAN_FEED_RESULT = "0B"
-CMD_MANUAL_FEED_RESULT = "0C"
-CMD_CHILD_LOCK = "0D"
-CMD_POWER_SUPPLY_METHOD = "0E"
-CMD_CONTROL_LED = "0F"
-CMD_AUTO_LOCK = "10"
-CMD_QUERY_FEEDER_PLAN = "11"
-CMD_REMINDER_TONE = "12"
-CMD_ATMOSPHERE_LIGHT = "13"
-CMD_DO_NOT_DISTURB_STATUS = "17"
-CMD_DO_NOT_DISTURB = "18"
-CMD_LONG_RING = "19"
+# Most recent notifications kept in FeederBLEProtocol.received_data
+RECEIVED_DATA_MAXLEN = 256
+
+# Seconds the firmware needs after the verification code before the next command
+_VERIFICATION_SETTLE_DELAY = 2.0
+
+# Command IDs (the command byte of a frame)
+CMD_QUERY_NAME_VERSION = 0x00
+CMD_SET_NAME = 0x01
+CMD_RESTORE_FACTORY = 0x02
+CMD_HEARTBEAT = 0x03
+CMD_QUERY_MAC = 0x04
+CMD_SYNC_TIME = 0x05
+CMD_SET_FAMILY_ID = 0x06
+CMD_SET_FEEDER_PLAN = 0x07
+CMD_FEEDING = 0x08
+CMD_FEEDING_STATUS = 0x09
+CMD_FAULT = 0x0A
+CMD_PLAN_FEED_RESULT = 0x0B
+CMD_MANUAL_FEED_RESULT = 0x0C
+CMD_CHILD_LOCK = 0x0D
+CMD_POWER_SUPPLY_METHOD = 0x0E
+CMD_CONTROL_LED = 0x0F
+CMD_AUTO_LOCK = 0x10
+CMD_QUERY_FEEDER_PLAN = 0x11
+CMD_REMINDER_TONE = 0x12
+CMD_ATMOSPHERE_LIGHT = 0x13
+CMD_DO_NOT_DISTURB_STATUS = 0x17
+CMD_DO_NOT_DISTURB = 0x18
+CMD_LONG_RING = 0x19
+
+
+def _command_byte(command: Union[int, str]) -> int:
+    """Command byte for a CMD_* constant; hex strings ("0A") are still accepted."""
+    return int(command, 16) if isinstance(command, str) else command
 
 
 # Service UUIDs for connection (per device type)
@@ -61,8 +79,32 @@ FEEDER_SERVICE_UUIDS = [
     ALI_FEEDER_SERVICE_UUID,
 ]
 
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    """GATT service and characteristic UUIDs for one feeder hardware family."""
+
+    service_uuid: str
+    write_uuid: str
+    notify_uuid: str
+
+
+DEVICE_PROFILES: Dict[str, DeviceProfile] = {
+    "standard": DeviceProfile(
+        FEEDER_SERVICE_UUID, FEEDER_WRITE_UUID, FEEDER_NOTIFY_UUID
+    ),
+    "jk": DeviceProfile(
+        JK_FEEDER_SERVICE_UUID, JK_FEEDER_WRITE_UUID, JK_FEEDER_NOTIFY_UUID
+    ),
+    "ali": DeviceProfile(
+        ALI_FEEDER_SERVICE_UUID, ALI_FEEDER_WRITE_UUID, ALI_FEEDER_NOTIFY_UUID
+    ),
+}
+
 # Name prefixes for discovery (Android app uses unfiltered scan + name prefix match via DeviceType.bleNames)
 FEEDER_NAME_PREFIXES = ("Du", "JK", "ALI", "PET", "FEED")
+# Uppercased once so name matching is a single str.startswith(tuple) call
+_FEEDER_NAME_PREFIXES_UPPER = tuple(p.upper() for p in FEEDER_NAME_PREFIXES)
 
 
 def detect_device_type(device_name: Optional[str] = None) -> str:
@@ -73,47 +115,385 @@ def detect_device_type(device_name: Optional[str] = None) -> str:
     name_upper = device_name.upper()
     if "JK" in name_upper:
         return "jk"
-    elif "ALI" in name_upper or "ALIBABA" in name_upper:
+    if "ALI" in name_upper:  # also covers "ALIBABA"
         return "ali"
     return "standard"
 
 
 def _is_feeder_by_name(name: str) -> bool:
     """True if the advertised name matches a known feeder name prefix (Android-style)."""
-    if not name or not name.strip():
+    if not name:
         return False
-    name_upper = name.strip().upper()
-    return any(name_upper.startswith(p.upper()) for p in FEEDER_NAME_PREFIXES)
+    return name.strip().upper().startswith(_FEEDER_NAME_PREFIXES_UPPER)
 
 
-async def discover_feeders(timeout: float = 10.0) -> List[Tuple[str, str, str]]:
+def _normalize_address(address) -> str:
+    """Insert colons into a bare 12-hex-digit address (e.g. "E6C00709A3D3")."""
+    addr = address if isinstance(address, str) else str(address)
+    if len(addr) == 12 and ":" not in addr:
+        return f"{addr[0:2]}:{addr[2:4]}:{addr[4:6]}:{addr[6:8]}:{addr[8:10]}:{addr[10:12]}"
+    return addr
+
+
+async def discover_feeders(
+    timeout: float = 10.0, limit: Optional[int] = None
+) -> List[Tuple[str, str, str]]:
     """
     Scan for Petnetizen feeder devices via BLE.
 
     Uses unfiltered BLE scan (no service-UUID filter), then recognizes feeders by
     advertised name prefix, matching the Android app behavior (bleNames / getDeviceTypeByName).
+    Advertisements are matched as they arrive; with ``limit`` set, the scan stops
+    as soon as that many feeders have been seen instead of running for ``timeout``.
 
     Returns:
         List of (address, name, device_type) for each feeder found.
         address is normalized (e.g. "E6:C0:07:09:A3:D3"), name is the advertised name,
         device_type is "standard", "jk", or "ali".
     """
-    devices = await BleakScanner.discover(timeout=timeout)
-    result: List[Tuple[str, str, str]] = []
-    seen: set = set()
-    for d in devices:
-        name = (d.name or "").strip()
+    # address -> (name, device_type); insertion order is discovery order
+    found: Dict[str, Tuple[str, str]] = {}
+    enough = asyncio.Event()
+
+    def _on_advertisement(device: BLEDevice, adv: AdvertisementData) -> None:
+        name = (adv.local_name or device.name or "").strip()
         if not _is_feeder_by_name(name):
-            continue
-        addr = d.address if isinstance(d.address, str) else str(d.address)
-        if len(addr) == 12 and ":" not in addr:
-            addr = ":".join(addr[i : i + 2] for i in range(0, 12, 2))
-        if addr in seen:
-            continue
-        seen.add(addr)
-        dev_type = detect_device_type(name)
-        result.append((addr, name, dev_type))
-    return result
+            return
+        addr = _normalize_address(device.address)
+        if addr in found:
+            return
+        found[addr] = (name, detect_device_type(name))
+        if limit is not None and len(found) >= limit:
+            enough.set()
+
+    async with BleakScanner(detection_callback=_on_advertisement):
+        try:
+            await asyncio.wait_for(enough.wait(), timeout)
+        except TimeoutError:
+            pass
+    return [(addr, name, dev_type) for addr, (name, dev_type) in found.items()]
+
+
+def enable_eager_tasks(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Install ``asyncio.eager_task_factory`` on *loop* (default: the running loop).
+
+    Eager tasks run synchronously until their first real suspension, so
+    ``asyncio.gather()`` over feeder queries skips a loop iteration per task.
+    This changes task scheduling for everything on that loop, so it is opt-in:
+    call it from your own ``main()``; the library never installs it itself.
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+
+
+# The payload-less state queries issued together by FeederBLEProtocol.query_all()
+_STATE_QUERIES = (
+    CMD_QUERY_NAME_VERSION,
+    CMD_FAULT,
+    CMD_CHILD_LOCK,
+    CMD_REMINDER_TONE,
+    CMD_FEEDING_STATUS,
+)
+
+# Notification command byte -> name
+_COMMAND_NAME_MAP = {
+    CMD_QUERY_NAME_VERSION: "NAME_AND_VERSION",
+    CMD_SET_NAME: "SET_NAME",
+    CMD_RESTORE_FACTORY: "RESTORE_FACTORY",
+    CMD_HEARTBEAT: "HEARTBEAT",
+    CMD_QUERY_MAC: "QUERY_MAC",
+    CMD_SYNC_TIME: "SYNC_TIME",
+    CMD_SET_FAMILY_ID: "SET_FAMILY_ID",
+    CMD_SET_FEEDER_PLAN: "SET_FEEDER_PLAN",
+    CMD_FEEDING: "FEEDING",
+    CMD_FEEDING_STATUS: "FEEDING_STATUS",
+    CMD_FAULT: "FAULT",
+    CMD_PLAN_FEED_RESULT: "PLAN_FEED_RESULT",
+    CMD_MANUAL_FEED_RESULT: "MANUAL_FEED_RESULT",
+    CMD_CHILD_LOCK: "CHILD_LOCK",
+    CMD_POWER_SUPPLY_METHOD: "POWER_SUPPLY_METHOD",
+    CMD_CONTROL_LED: "CONTROL_LED",
+    CMD_AUTO_LOCK: "AUTO_LOCK",
+    CMD_QUERY_FEEDER_PLAN: "QUERY_FEEDER_PLAN",
+    CMD_REMINDER_TONE: "REMINDER_TONE",
+    CMD_ATMOSPHERE_LIGHT: "ATMOSPHERE_LIGHT",
+    CMD_DO_NOT_DISTURB_STATUS: "DO_NOT_DISTURB_STATUS",
+    CMD_DO_NOT_DISTURB: "DO_NOT_DISTURB",
+    CMD_LONG_RING: "LONG_RING",
+}
+# ... as a tuple indexed directly by the raw byte (no hashing per notification)
+_COMMAND_NAMES: Tuple[str, ...] = tuple(
+    _COMMAND_NAME_MAP.get(byte, "UNKNOWN") for byte in range(256)
+)
+
+# CMD_FEEDING_STATUS value -> text
+_FEEDING_STATUS_TEXT = ("Idle", "Feeding", "Error")
+
+# Frames for the payload-less commands (queries, heartbeat) never change, so
+# build them once at import: EA + cmd + 00 (length) + 00 (CRC) + AE
+_STATIC_FRAMES: Dict[int, bytes] = {
+    command: bytes((0xEA, command, 0x00, 0x00, 0xAE))
+    for command in (
+        CMD_QUERY_NAME_VERSION,
+        CMD_HEARTBEAT,
+        CMD_QUERY_MAC,
+        CMD_FEEDING_STATUS,
+        CMD_FAULT,
+        CMD_CHILD_LOCK,
+        CMD_QUERY_FEEDER_PLAN,
+        CMD_REMINDER_TONE,
+        CMD_DO_NOT_DISTURB_STATUS,
+    )
+}
+
+
+# Per-command payload decoders, indexed by the raw command byte.  Each entry is
+# (minimum data-section length, decoder(data_section, result)).
+_Decoder = Callable[[bytearray, dict], None]
+_DECODERS: List[Optional[Tuple[int, _Decoder]]] = [None] * 256
+
+
+def _decoder(*commands: int, min_len: int = 1) -> Callable[[_Decoder], _Decoder]:
+    """Register the decorated function as the decoder for ``commands``."""
+
+    def register(func: _Decoder) -> _Decoder:
+        for command in commands:
+            _DECODERS[command] = (min_len, func)
+        return func
+
+    return register
+
+
+@_decoder(CMD_QUERY_NAME_VERSION, min_len=12)
+def _decode_name_version(data_section: bytearray, result: dict) -> None:
+    try:
+        name = data_section[:12].decode("utf-8", errors="ignore").strip("\x00").strip()
+        if name:
+            result["device_name"] = name
+        if len(data_section) > 12:
+            version = (
+                data_section[12:].decode("utf-8", errors="ignore").strip("\x00").strip()
+            )
+            if version:
+                result["device_version"] = version
+    except Exception:
+        pass
+
+
+@_decoder(CMD_FAULT)
+def _decode_fault(data_section: bytearray, result: dict) -> None:
+    result["fault_code"] = data_section[0]
+
+
+@_decoder(CMD_POWER_SUPPLY_METHOD)
+def _decode_power_mode(data_section: bytearray, result: dict) -> None:
+    result["power_mode"] = "Battery" if data_section[0] == 0 else "DC Power"
+
+
+@_decoder(CMD_FEEDING_STATUS)
+def _decode_feeding_status(data_section: bytearray, result: dict) -> None:
+    status = data_section[0]
+    result["feeding_status"] = status
+    result["feeding_status_text"] = (
+        _FEEDING_STATUS_TEXT[status]
+        if status < len(_FEEDING_STATUS_TEXT)
+        else f"Unknown({status})"
+    )
+
+
+@_decoder(CMD_CHILD_LOCK)
+def _decode_child_lock(data_section: bytearray, result: dict) -> None:
+    result["child_lock"] = data_section[0]
+    result["child_lock_text"] = "LOCKED" if data_section[0] == 1 else "UNLOCKED"
+
+
+@_decoder(CMD_CONTROL_LED)
+def _decode_led(data_section: bytearray, result: dict) -> None:
+    result["led"] = bool(data_section[0])
+
+
+@_decoder(CMD_AUTO_LOCK)
+def _decode_auto_lock(data_section: bytearray, result: dict) -> None:
+    result["auto_lock"] = bool(data_section[0])
+
+
+@_decoder(CMD_REMINDER_TONE)
+def _decode_prompt_sound(data_section: bytearray, result: dict) -> None:
+    result["prompt_sound"] = data_section[0]
+    result["prompt_sound_text"] = "ON" if data_section[0] == 1 else "OFF"
+
+
+@_decoder(CMD_ATMOSPHERE_LIGHT)
+def _decode_atmosphere_light(data_section: bytearray, result: dict) -> None:
+    result["atmosphere_light"] = bool(data_section[0])
+
+
+@_decoder(CMD_DO_NOT_DISTURB_STATUS, CMD_DO_NOT_DISTURB, min_len=5)
+def _decode_do_not_disturb(data_section: bytearray, result: dict) -> None:
+    result["do_not_disturb"] = bool(data_section[0])
+    result["dnd_start"] = f"{data_section[1]:02d}:{data_section[2]:02d}"
+    result["dnd_end"] = f"{data_section[3]:02d}:{data_section[4]:02d}"
+
+
+@_decoder(CMD_LONG_RING)
+def _decode_long_ring(data_section: bytearray, result: dict) -> None:
+    result["long_ring"] = bool(data_section[0])
+
+
+@_decoder(CMD_FEEDING)
+def _decode_feed_response(data_section: bytearray, result: dict) -> None:
+    result["feed_response"] = data_section[0]
+    result["feed_response_text"] = (
+        "Triggered" if data_section[0] == 1 else f"Status({data_section[0]})"
+    )
+
+
+# SYNC_TIME payload: yy mm dd hh mm ss (year as 2 digits)
+_SYNC_TIME_STRUCT = struct.Struct("6B")
+
+# MANUAL_FEED_RESULT records: yy mm dd hh mm ss portions feed_type status
+_FEED_RECORD_STRUCT = struct.Struct("9B")
+_FEED_TYPE_TEXT = ("Unknown(0)", "Manual", "Plan")
+_FEED_RESULT_TEXT = ("Success", "Failed")
+# One printf-style pass over the six date/time bytes
+_FEED_TIMESTAMP_FORMAT = "20%02d-%02d-%02d %02d:%02d:%02d"
+
+
+@_decoder(CMD_MANUAL_FEED_RESULT, min_len=_FEED_RECORD_STRUCT.size)
+def _decode_feed_records(data_section: bytearray, result: dict) -> None:
+    size = _FEED_RECORD_STRUCT.size
+    whole = memoryview(data_section)[: len(data_section) // size * size]
+    records = []
+    for record in _FEED_RECORD_STRUCT.iter_unpack(whole):
+        portions, feed_type, status = record[6:]
+        records.append(
+            {
+                "timestamp": _FEED_TIMESTAMP_FORMAT % record[:6],
+                "portions": portions,
+                "feed_type": _FEED_TYPE_TEXT[feed_type]
+                if feed_type < len(_FEED_TYPE_TEXT)
+                else f"Unknown({feed_type})",
+                "status": _FEED_RESULT_TEXT[status]
+                if status < len(_FEED_RESULT_TEXT)
+                else f"Unknown({status})",
+            }
+        )
+    result["feed_records"] = records
+
+
+@_decoder(CMD_SET_FAMILY_ID)
+def _decode_verification(data_section: bytearray, result: dict) -> None:
+    result["verification_response"] = data_section[0]
+    result["verification_success"] = data_section[0] == 1
+
+
+# Weekday names for every 7-bit week mask, so a slot's days are one lookup
+_WEEKDAY_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(day for day, bit in WEEKDAY_BITMASK.items() if mask & bit)
+    for mask in range(128)
+)
+
+
+@_decoder(CMD_QUERY_FEEDER_PLAN, min_len=0)
+def _decode_feed_plan(data_section: bytearray, result: dict) -> None:
+    # QUERY_FEEDER_PLAN response: 5 bytes per slot (week, hour, minute, portions, enabled)
+    # Some firmwares send [num_slots] + slots; others send slots only
+    size = _SLOT_STRUCT.size
+    offset = 0
+    if len(data_section) >= 1 and 1 <= data_section[0] <= 15:
+        # First byte might be slot count
+        n = data_section[0]
+        if len(data_section) >= 1 + size * n:
+            offset = 1
+    end = offset + (len(data_section) - offset) // size * size
+    slots = [
+        {
+            "weekdays": list(_WEEKDAY_TABLE[week_val & 0x7F]),
+            "time": f"{hour:02d}:{minute:02d}",
+            "portions": portions,
+            "enabled": bool(enabled),
+        }
+        for week_val, hour, minute, portions, enabled in _SLOT_STRUCT.iter_unpack(
+            memoryview(data_section)[offset:end]
+        )
+    ]
+    if slots:
+        result["feed_plan_slots"] = slots
+
+
+@dataclass(frozen=True, slots=True)
+class FeederFrame:
+    """One notification frame: EA + command + length + payload + CRC + AE.
+
+    Holds only the frame's fields; to_dict() builds the descriptive dict
+    returned by FeederBLEProtocol.decode_notification(), and fields() just
+    the command-specific values, without any hex formatting.
+    """
+
+    header: int
+    command: int
+    length: int
+    payload: bytes
+    crc: int
+    footer: int
+    # The frame as received, when known; to_bytes() returns it without rebuilding
+    _raw: Optional[bytes] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FeederFrame":
+        """Split a complete frame (at least 6 bytes) into its fields.
+
+        Immutable ``bytes`` input is kept by reference, not copied.
+        """
+        if len(data) < 6:
+            raise ValueError(f"Frame too short ({len(data)} bytes)")
+        raw = data if isinstance(data, bytes) else bytes(data)
+        return cls(raw[0], raw[1], raw[2], raw[3:-2], raw[-2], raw[-1], raw)
+
+    @property
+    def command_name(self) -> str:
+        return _COMMAND_NAMES[self.command]
+
+    def to_bytes(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+        return (
+            bytes((self.header, self.command, self.length))
+            + self.payload
+            + bytes((self.crc, self.footer))
+        )
+
+    def fields(self) -> dict:
+        """Command-specific decoded values (e.g. ``{"child_lock": 1, ...}``)."""
+        result: dict = {}
+        decoder = _DECODERS[self.command]
+        if decoder is not None and len(self.payload) >= decoder[0]:
+            try:
+                decoder[1](self.payload, result)
+            except Exception as e:
+                result["error"] = str(e)
+        return result
+
+    def to_dict(self) -> dict:
+        """The full descriptive dict: raw/header/command/... plus fields()."""
+        raw = self.to_bytes()
+        # Format the frame as hex once; every hex field is a slice of it
+        raw_hex = raw.hex().upper()
+        result = {
+            "raw": raw_hex,
+            "raw_bytes": raw,
+            "header": raw_hex[0:2],
+            "command": raw_hex[2:4],
+            "command_name": _COMMAND_NAMES[self.command],
+            "footer": raw_hex[-2:],
+            "length": self.length,
+            "crc": raw_hex[-4:-2],
+            "data_hex": raw_hex[6:-4],
+            "data_bytes": self.payload,
+        }
+        result.update(self.fields())
+        return result
 
 
 class FeederBLEProtocol:
@@ -124,30 +504,34 @@ class FeederBLEProtocol:
         self.device_type = device_type or detect_device_type()
         self._managed_connection = False
 
-        # Select UUIDs based on device type
-        if self.device_type == "jk":
-            self.service_uuid = JK_FEEDER_SERVICE_UUID
-            self.write_uuid = JK_FEEDER_WRITE_UUID
-            self.notify_uuid = JK_FEEDER_NOTIFY_UUID
-        elif self.device_type == "ali":
-            self.service_uuid = ALI_FEEDER_SERVICE_UUID
-            self.write_uuid = ALI_FEEDER_WRITE_UUID
-            self.notify_uuid = ALI_FEEDER_NOTIFY_UUID
-        else:  # standard
-            self.service_uuid = FEEDER_SERVICE_UUID
-            self.write_uuid = FEEDER_WRITE_UUID
-            self.notify_uuid = FEEDER_NOTIFY_UUID
+        # Select UUIDs based on device type (unknown types use the standard profile)
+        profile = DEVICE_PROFILES.get(self.device_type, DEVICE_PROFILES["standard"])
+        self.service_uuid = profile.service_uuid
+        self.write_uuid = profile.write_uuid
+        self.notify_uuid = profile.notify_uuid
 
         self.client: Optional[BleakClient] = None
-        self.received_data = []
+        # Link state tracked through bleak's disconnected_callback for clients
+        # we create; None means the client was supplied externally (we can't
+        # register the callback), so ask the client itself.
+        self._link_up: Optional[bool] = None
+        # Bounded so a long-lived (e.g. Home Assistant) session cannot grow it
+        # without limit; responses are routed via expect_notification().
+        self.received_data: Deque[bytes] = deque(maxlen=RECEIVED_DATA_MAXLEN)
         self.write_characteristic = None
         self.notify_characteristic = None
         self.supports_write_response = False
         self.supports_write_no_response = True
+        self.mtu = 23  # ATT default until negotiated in connect()
+        # Largest single write without response (MTU - 3); see send_frame()
+        self.max_write_size = 20
         self.last_feed_result: Optional[dict] = None
+        # Futures waiting for the next notification of a given command byte,
+        # resolved by notification_handler — see expect_notification().
+        self._pending: Dict[int, List[asyncio.Future]] = {}
 
     def hex_string_to_bytes(self, hex_string: str) -> bytes:
-        """Convert hex string to bytes"""
+        """Convert hex string to bytes (spaces and dashes are ignored)"""
         return bytes.fromhex(hex_string.replace(" ", "").replace("-", ""))
 
     def bytes_to_hex_string(self, data: bytes) -> str:
@@ -155,251 +539,124 @@ class FeederBLEProtocol:
         return data.hex().upper()
 
     def encode_command(
-        self, command: str, length: Optional[int] = None, action_hex: str = ""
+        self,
+        command: Union[int, str],
+        length: Optional[int] = None,
+        action_hex: str = "",
+        *,
+        action: bytes = b"",
     ) -> bytes:
         """
         Encode a command according to Tuya BLE protocol.
 
         Format: EA + Command + Length + Data + CRC(00) + AE
+
+        The payload is given either as raw bytes (``action``) or as a hex
+        string (``action_hex``); prefer ``action`` when the caller already
+        holds bytes, which avoids a bytes → hex → bytes round-trip.
+        ``command`` is a CMD_* constant (a hex string such as "0A" also works).
         """
+        command = _command_byte(command)
+        if action_hex and not action:
+            action = self.hex_string_to_bytes(action_hex)
+        if not action and not length and command in _STATIC_FRAMES:
+            return _STATIC_FRAMES[command]
         if length is None:
-            length = len(action_hex) // 2
-
-        command_int = int(command, 16)
-        command_bytes = bytearray()
-        command_bytes.append(0xEA)  # Header
-        command_bytes.append(command_int)  # Command byte
-        command_bytes.append(length)  # Length byte
+            length = len(action)
 
-        if action_hex:
-            data_bytes = self.hex_string_to_bytes(action_hex)
-            command_bytes.extend(data_bytes)
-
-        command_bytes.append(0x00)  # CRC placeholder
-        command_bytes.append(0xAE)  # Footer
-
-        return bytes(command_bytes)
+        # Header, command, length + payload + CRC placeholder, footer
+        return bytes((0xEA, command, length)) + action + b"\x00\xae"
 
     def decode_notification(self, data: bytearray) -> dict:
-        """Decode notification data"""
+        """Decode notification data into the descriptive dict (see FeederFrame.to_dict)."""
+        if len(data) >= 6:
+            return FeederFrame.from_bytes(data).to_dict()
         if len(data) < 4:
             return {"error": "Data too short"}
-
-        result = {"raw": self.bytes_to_hex_string(data), "raw_bytes": data}
-
-        try:
-            header = data[0]
-            command_byte = data[1]
-            command_hex = f"{command_byte:02X}"
-
-            result["header"] = f"{header:02X}"
-            result["command"] = command_hex
-
-            command_map = {
-                "00": "NAME_AND_VERSION",
-                "01": "SET_NAME",
-                "02": "RESTORE_FACTORY",
-                "03": "HEARTBEAT",
-                "04": "QUERY_MAC",
-                "05": "SYNC_TIME",
-                "06": "SET_FAMILY_ID",
-                "07": "SET_FEEDER_PLAN",
-                "08": "FEEDING",
-                "09": "FEEDING_STATUS",
-                "0A": "FAULT",
-                "0B": "PLAN_FEED_RESULT",
-                "0C": "MANUAL_FEED_RESULT",
-                "0D": "CHILD_LOCK",
-                "0E": "POWER_SUPPLY_METHOD",
-                "0F": "CONTROL_LED",
-                "10": "AUTO_LOCK",
-                "11": "QUERY_FEEDER_PLAN",
-                "12": "REMINDER_TONE",
-                "13": "ATMOSPHERE_LIGHT",
-                "17": "DO_NOT_DISTURB_STATUS",
-                "18": "DO_NOT_DISTURB",
-                "19": "LONG_RING",
-            }
-            result["command_name"] = command_map.get(command_hex, "UNKNOWN")
-
-            if len(data) >= 6:
-                footer = data[-1]
-                result["footer"] = f"{footer:02X}"
-                length_byte = data[2]
-                result["length"] = length_byte
-
-                crc_byte = data[-2] if len(data) > 2 else None
-                if crc_byte is not None:
-                    result["crc"] = f"{crc_byte:02X}"
-
-                data_section = data[3:-2] if len(data) > 5 else data[3:-1]
-                result["data_hex"] = self.bytes_to_hex_string(data_section)
-                result["data_bytes"] = bytes(data_section)
-
-                # Parse specific commands
-                if command_hex == "00" and len(data_section) >= 12:
-                    try:
-                        name = (
-                            data_section[:12]
-                            .decode("utf-8", errors="ignore")
-                            .strip("\x00")
-                            .strip()
-                        )
-                        if name:
-                            result["device_name"] = name
-                        if len(data_section) > 12:
-                            version = (
-                                data_section[12:]
-                                .decode("utf-8", errors="ignore")
-                                .strip("\x00")
-                                .strip()
-                            )
-                            if version:
-                                result["device_version"] = version
-                    except Exception:
-                        pass
-                elif command_hex == "0A" and len(data_section) >= 1:
-                    result["fault_code"] = data_section[0]
-                elif command_hex == "0E" and len(data_section) >= 1:
-                    result["power_mode"] = (
-                        "Battery" if data_section[0] == 0 else "DC Power"
-                    )
-                elif command_hex == "09" and len(data_section) >= 1:
-                    status_map = {0: "Idle", 1: "Feeding", 2: "Error"}
-                    result["feeding_status"] = data_section[0]
-                    result["feeding_status_text"] = status_map.get(
-                        data_section[0], f"Unknown({data_section[0]})"
-                    )
-                elif command_hex == "0D" and len(data_section) >= 1:
-                    result["child_lock"] = data_section[0]
-                    result["child_lock_text"] = (
-                        "LOCKED" if data_section[0] == 1 else "UNLOCKED"
-                    )
-                elif command_hex == "0F" and len(data_section) >= 1:
-                    result["led"] = bool(data_section[0])
-                elif command_hex == "10" and len(data_section) >= 1:
-                    result["auto_lock"] = bool(data_section[0])
-                elif command_hex == "12" and len(data_section) >= 1:
-                    result["prompt_sound"] = data_section[0]
-                    result["prompt_sound_text"] = (
-                        "ON" if data_section[0] == 1 else "OFF"
-                    )
-                elif command_hex == "13" and len(data_section) >= 1:
-                    result["atmosphere_light"] = bool(data_section[0])
-                elif command_hex in ("17", "18") and len(data_section) >= 5:
-                    result["do_not_disturb"] = bool(data_section[0])
-                    result["dnd_start"] = f"{data_section[1]:02d}:{data_section[2]:02d}"
-                    result["dnd_end"] = f"{data_section[3]:02d}:{data_section[4]:02d}"
-                elif command_hex == "19" and len(data_section) >= 1:
-                    result["long_ring"] = bool(data_section[0])
-                elif command_hex == "08" and len(data_section) >= 1:
-                    result["feed_response"] = data_section[0]
-                    result["feed_response_text"] = (
-                        "Triggered"
-                        if data_section[0] == 1
-                        else f"Status({data_section[0]})"
-                    )
-                elif command_hex == "0C" and len(data_section) >= 9:
-                    # Parse feed records (9 bytes each)
-                    feed_records = []
-                    num_records = len(data_section) // 9
-                    for i in range(num_records):
-                        offset = i * 9
-                        if offset + 9 <= len(data_section):
-                            record = data_section[offset : offset + 9]
-                            timestamp = f"20{record[0]:02d}-{record[1]:02d}-{record[2]:02d} {record[3]:02d}:{record[4]:02d}:{record[5]:02d}"
-                            feed_records.append(
-                                {
-                                    "timestamp": timestamp,
-                                    "portions": record[6],
-                                    "feed_type": "Manual"
-                                    if record[7] == 1
-                                    else "Plan"
-                                    if record[7] == 2
-                                    else f"Unknown({record[7]})",
-                                    "status": "Success"
-                                    if record[8] == 0
-                                    else "Failed"
-                                    if record[8] == 1
-                                    else f"Unknown({record[8]})",
-                                }
-                            )
-                    if feed_records:
-                        result["feed_records"] = feed_records
-                elif command_hex == "06" and len(data_section) >= 1:
-                    result["verification_response"] = data_section[0]
-                    result["verification_success"] = data_section[0] == 1
-                elif command_hex == "11":
-                    # QUERY_FEEDER_PLAN response: 5 bytes per slot (week, hour, minute, portions, enabled)
-                    # Some firmwares send [num_slots] + slots; others send slots only
-                    slots = []
-                    offset = 0
-                    if len(data_section) >= 1 and 1 <= data_section[0] <= 15:
-                        # First byte might be slot count
-                        n = data_section[0]
-                        if len(data_section) >= 1 + 5 * n:
-                            offset = 1
-                    while offset + 5 <= len(data_section):
-                        week_val, hour, minute, portions, enabled = data_section[
-                            offset : offset + 5
-                        ]
-                        weekdays = [
-                            d
-                            for bit, d in [
-                                (1, "sun"),
-                                (2, "mon"),
-                                (4, "tue"),
-                                (8, "wed"),
-                                (16, "thu"),
-                                (32, "fri"),
-                                (64, "sat"),
-                            ]
-                            if week_val & bit
-                        ]
-                        slots.append(
-                            {
-                                "weekdays": weekdays,
-                                "time": f"{hour:02d}:{minute:02d}",
-                                "portions": portions,
-                                "enabled": bool(enabled),
-                            }
-                        )
-                        offset += 5
-                    if slots:
-                        result["feed_plan_slots"] = slots
-        except Exception as e:
-            result["error"] = str(e)
-
-        return result
+        command_byte = data[1]
+        return {
+            "raw": data.hex().upper(),
+            "raw_bytes": data,
+            "header": f"{data[0]:02X}",
+            "command": f"{command_byte:02X}",
+            "command_name": _COMMAND_NAMES[command_byte],
+        }
 
     def clear_notifications(self) -> None:
         """Clear accumulated notification data."""
         self.received_data.clear()
 
+    def expect_notification(self, *commands: Union[int, str]) -> asyncio.Future:
+        """Return a future resolved with the next decoded notification for any of *commands*.
+
+        Call this *before* writing the request so a fast response cannot
+        arrive between the write and the wait.  Cancel the future (or let
+        wait_for_notification() time out) if the response is no longer needed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        for command in commands:
+            self._pending.setdefault(_command_byte(command), []).append(future)
+        future.add_done_callback(self._discard_waiter)
+        return future
+
+    async def wait_for_notification(
+        self, future: asyncio.Future, timeout: float
+    ) -> Optional[dict]:
+        """Wait for a future from expect_notification(); None on timeout."""
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            return None
+
+    def _discard_waiter(self, future: asyncio.Future) -> None:
+        """Drop a finished future from the waiters of every command it was registered for."""
+        for command, waiters in list(self._pending.items()):
+            if future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._pending[command]
+
     def notification_handler(self, sender: BleakGATTCharacteristic, data: bytearray):
         """Handle notifications from the device."""
-        _LOGGER.debug(
-            "[%s] Notification received: %s (%d bytes)",
-            self.device_address,
-            data.hex().upper(),
-            len(data),
-        )
+        # Skip the hex dump entirely unless debug logging is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] Notification received: %s (%d bytes)",
+                self.device_address,
+                data.hex().upper(),
+                len(data),
+            )
+        # Snapshot the payload: bleak may reuse the bytearray it hands us, and
+        # both received_data and the decoded results outlive this callback.
+        data = bytes(data)
         self.received_data.append(data)
 
         if len(data) >= 2:
-            cmd = f"{data[1]:02X}"
+            cmd = data[1]
 
-            # Track last completed manual feed result inline so it's always current
-            if cmd == "0C":
+            decoded = None
+            waiters = self._pending.pop(cmd, None)
+            if waiters:
                 decoded = self.decode_notification(data)
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(decoded)
+
+            # Track last completed manual feed result inline so it's always current
+            if cmd == CMD_MANUAL_FEED_RESULT:
+                if decoded is None:
+                    # Nobody is waiting: decode only the records, skip the hex dump
+                    decoded = (
+                        FeederFrame.from_bytes(data).fields() if len(data) >= 6 else {}
+                    )
                 if decoded.get("feed_records"):
                     self.last_feed_result = decoded["feed_records"][-1]
 
-            # The feeder firmware pushes CMD_SYNC_TIME ("05") as a device-initiated
+            # The feeder firmware pushes CMD_SYNC_TIME (0x05) as a device-initiated
             # request for the current time.  The Android app responds immediately via
             # BleSyncTimeCodec.handlerController → BleDeviceController.syncTime().
             # If we ignore it the feeder clock stays wrong (e.g. after a power outage).
-            elif cmd == "05":
+            elif cmd == CMD_SYNC_TIME:
                 _LOGGER.debug(
                     "[%s] Device requested time sync — scheduling auto-response",
                     self.device_address,
@@ -409,10 +666,10 @@ class FeederBLEProtocol:
                 except RuntimeError:
                     pass  # No event loop running (unlikely in BLE context)
 
-            # Some firmware builds initiate CMD_HEARTBEAT ("03") from the device side
+            # Some firmware builds initiate CMD_HEARTBEAT (0x03) from the device side
             # and expect an echo ACK.  The Android product-test controller replies with
             # the same command / length 0.  We mirror that here to keep parity.
-            elif cmd == "03":
+            elif cmd == CMD_HEARTBEAT:
                 _LOGGER.debug(
                     "[%s] Device heartbeat ping — scheduling echo ACK",
                     self.device_address,
@@ -426,11 +683,17 @@ class FeederBLEProtocol:
         """Request an MTU exchange, mirroring the Android app's requestMtu(512).
 
         Tries the backend-specific ``request_mtu`` when available (e.g. the
-        ESPHome BLE proxy exposes it).  Falls back to reading the current
-        ``mtu_size`` property, which is always safe.
+        ESPHome BLE proxy exposes it).  BlueZ negotiates the MTU itself on
+        connect but bleak only learns the result via ``_acquire_mtu()``;
+        without it ``mtu_size`` reports the 23-byte default.  Falls back to
+        reading the current ``mtu_size`` property, which is always safe.
         """
         try:
             backend = getattr(self.client, "_backend", None)
+            if backend and hasattr(backend, "_acquire_mtu"):
+                await backend._acquire_mtu()
+                return getattr(self.client, "mtu_size", 23)
+
             if backend and hasattr(backend, "request_mtu"):
                 mtu = await backend.request_mtu(desired_mtu)
                 return (
@@ -456,6 +719,35 @@ class FeederBLEProtocol:
             )
             return getattr(self.client, "mtu_size", 23)
 
+    def _max_write_size(self) -> int:
+        """Payload bytes one write without response can carry on this link."""
+        size = getattr(
+            self.write_characteristic, "max_write_without_response_size", None
+        )
+        if isinstance(size, int) and size > 0:
+            return size
+        return max(20, self.mtu - 3)
+
+    async def send_frame(self, frame: bytes) -> None:
+        """Write an encoded frame to the write characteristic without response.
+
+        The frame always goes out as a single write: nothing shows the firmware
+        reassembles a frame split across writes. A frame longer than
+        ``max_write_size`` (e.g. a full feed plan on a link still at the
+        23-byte default MTU) is logged as a warning and left to the backend.
+        """
+        if len(frame) > self.max_write_size:
+            _LOGGER.warning(
+                "[%s] %d-byte frame exceeds the %d-byte write limit of this link; "
+                "the device may reject or truncate it",
+                self.device_address,
+                len(frame),
+                self.max_write_size,
+            )
+        # The characteristic resolved at connect time spares bleak a UUID lookup
+        target = self.write_characteristic or self.write_uuid
+        await self.client.write_gatt_char(target, frame, response=False)
+
     async def _do_start_notify(self) -> bool:
         """Write CCCD 0x0001 to enable notifications, with retry on transient failure."""
         max_attempts = 3
@@ -503,16 +795,28 @@ class FeederBLEProtocol:
         enable_notifications: bool = True,
     ) -> bool:
         """Connect to the device. If ble_client is provided (e.g. from bleak_retry_connector), use it."""
+        # Characteristics belong to one client's service collection; re-resolved below
+        self.write_characteristic = None
+        self.notify_characteristic = None
         if ble_client is not None:
             _LOGGER.debug("[%s] Using provided BleakClient", self.device_address)
             self.client = ble_client
+            self._link_up = None
         else:
             _LOGGER.debug(
                 "[%s] Creating BleakClient (timeout=%ss)",
                 self.device_address,
                 timeout,
             )
-            self.client = BleakClient(self.device_address, timeout=timeout)
+            # Only the feeder service is used, so limit discovery to it: the
+            # backend skips enumerating every other service on each connect.
+            self.client = BleakClient(
+                self.device_address,
+                timeout=timeout,
+                disconnected_callback=self._on_disconnected,
+                services=[self.service_uuid],
+            )
+            self._link_up = False
             try:
                 await self.client.connect()
             except Exception as exc:
@@ -522,6 +826,7 @@ class FeederBLEProtocol:
                     exc,
                 )
                 return False
+            self._link_up = True
 
         # Access GATT services discovered during connect().  Modern bleak (0.20+)
         # and HaBleakClientWrapper (bleak-retry-connector) expose services via
@@ -579,8 +884,14 @@ class FeederBLEProtocol:
             # subsequent CCCD write for start_notify can hit the feeder
             # before its BLE stack is prepared, causing Error 19 —
             # especially through an ESP32 BLE proxy.
-            mtu = await self._request_mtu(512)
-            _LOGGER.debug("[%s] MTU: %d", self.device_address, mtu)
+            self.mtu = await self._request_mtu(512)
+            self.max_write_size = self._max_write_size()
+            _LOGGER.debug(
+                "[%s] MTU: %d (max write %d)",
+                self.device_address,
+                self.mtu,
+                self.max_write_size,
+            )
 
             if not enable_notifications:
                 # Caller will authenticate (send verification code) and then
@@ -597,16 +908,56 @@ class FeederBLEProtocol:
             )
             return False
 
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """bleak disconnected_callback for clients created by connect()."""
+        if client is self.client:
+            _LOGGER.debug("[%s] Link dropped", self.device_address)
+            self._link_up = False
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the BLE link is up (cached for clients created by connect())."""
+        if self._link_up is not None:
+            return self._link_up
+        return self.client is not None and self.client.is_connected
+
+    def detach_client(self) -> None:
+        """Forget the current client and its link state without touching the link.
+
+        Used after the caller has disconnected (or given up on) the client
+        itself; the next connect() starts from a clean slate.
+        """
+        self.client = None
+        self._link_up = None
+        self.write_characteristic = None
+        self.notify_characteristic = None
+
+    async def _request(
+        self, frame: bytes, timeout: float, replies: Tuple[int, ...] = ()
+    ) -> Optional[dict]:
+        """Write *frame* and wait up to *timeout* seconds for the reply to its command.
+
+        The reply is expected on the frame's own command unless *replies* names
+        the command(s) to wait for.  Returns the decoded reply as soon as it
+        arrives, or None if none came in time.  The waiter is registered before
+        the write so a fast reply cannot be missed.
+        """
+        reply = self.expect_notification(*(replies or (frame[1],)))
+        try:
+            await self.send_frame(frame)
+            return await self.wait_for_notification(reply, timeout)
+        finally:
+            reply.cancel()
+
     async def set_led(self, enabled: bool):
         """Set LED on/off."""
         if not await self._ensure_connected():
             return
         command = self.encode_command(
-            CMD_CONTROL_LED, length=1, action_hex="01" if enabled else "00"
+            CMD_CONTROL_LED, length=1, action=b"\x01" if enabled else b"\x00"
         )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(0.5)
+            return await self._request(command, 0.5)
         except Exception as exc:
             _LOGGER.warning("[%s] Failed to set LED: %s", self.device_address, exc)
 
@@ -615,11 +966,10 @@ class FeederBLEProtocol:
         if not await self._ensure_connected():
             return
         command = self.encode_command(
-            CMD_AUTO_LOCK, length=1, action_hex="01" if enabled else "00"
+            CMD_AUTO_LOCK, length=1, action=b"\x01" if enabled else b"\x00"
         )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(0.5)
+            return await self._request(command, 0.5)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to set auto lock: %s", self.device_address, exc
@@ -630,11 +980,10 @@ class FeederBLEProtocol:
         if not await self._ensure_connected():
             return
         command = self.encode_command(
-            CMD_ATMOSPHERE_LIGHT, length=1, action_hex="01" if enabled else "00"
+            CMD_ATMOSPHERE_LIGHT, length=1, action=b"\x01" if enabled else b"\x00"
         )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(0.5)
+            return await self._request(command, 0.5)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to set atmosphere light: %s", self.device_address, exc
@@ -644,23 +993,27 @@ class FeederBLEProtocol:
         """Send factory reset command."""
         if not await self._ensure_connected():
             return
-        command = self.encode_command(CMD_RESTORE_FACTORY, length=1, action_hex="01")
+        command = self.encode_command(CMD_RESTORE_FACTORY, length=1, action=b"\x01")
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1.0)
+            return await self._request(command, 1.0)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to send factory reset: %s", self.device_address, exc
             )
 
-    async def query_do_not_disturb(self):
-        """Query do-not-disturb status."""
+    async def query_do_not_disturb(self, timeout: float = 1.0) -> Optional[dict]:
+        """Query do-not-disturb status.
+
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_DO_NOT_DISTURB_STATUS, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_DO_NOT_DISTURB_STATUS]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1.0)
+            # Some firmwares answer the status query with a DO_NOT_DISTURB frame
+            return await self._request(
+                command, timeout, (CMD_DO_NOT_DISTURB_STATUS, CMD_DO_NOT_DISTURB)
+            )
         except Exception as exc:
             _LOGGER.warning("[%s] Failed to query DND: %s", self.device_address, exc)
 
@@ -676,11 +1029,11 @@ class FeederBLEProtocol:
         except (ValueError, AttributeError):
             _LOGGER.warning("[%s] Invalid DND time format", self.device_address)
             return
-        action = f"{'01' if enabled else '00'}{sh:02X}{sm:02X}{eh:02X}{em:02X}"
-        command = self.encode_command(CMD_DO_NOT_DISTURB, length=5, action_hex=action)
+        command = self.encode_command(
+            CMD_DO_NOT_DISTURB, length=5, action=bytes((bool(enabled), sh, sm, eh, em))
+        )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(0.5)
+            return await self._request(command, 0.5)
         except Exception as exc:
             _LOGGER.warning("[%s] Failed to set DND: %s", self.device_address, exc)
 
@@ -689,11 +1042,10 @@ class FeederBLEProtocol:
         if not await self._ensure_connected():
             return
         command = self.encode_command(
-            CMD_LONG_RING, length=1, action_hex="01" if enabled else "00"
+            CMD_LONG_RING, length=1, action=b"\x01" if enabled else b"\x00"
         )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(0.5)
+            return await self._request(command, 0.5)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to set long ring: %s", self.device_address, exc
@@ -704,7 +1056,9 @@ class FeederBLEProtocol:
         if self.client and self.client.is_connected:
             _LOGGER.debug("[%s] Disconnecting", self.device_address)
             try:
-                await self.client.stop_notify(self.notify_uuid)
+                await self.client.stop_notify(
+                    self.notify_characteristic or self.notify_uuid
+                )
             except Exception as exc:
                 _LOGGER.debug(
                     "[%s] Error stopping notifications during disconnect: %s",
@@ -726,7 +1080,9 @@ class FeederBLEProtocol:
             try:
                 if self.client.is_connected:
                     try:
-                        await self.client.stop_notify(self.notify_uuid)
+                        await self.client.stop_notify(
+                            self.notify_characteristic or self.notify_uuid
+                        )
                     except Exception:
                         pass
                     await self.client.disconnect()
@@ -737,27 +1093,41 @@ class FeederBLEProtocol:
         )
 
     async def send_verification_code(self, code: str = DEFAULT_VERIFICATION_CODE):
-        """Send verification code to the device"""
-        command = self.encode_command(CMD_SET_FAMILY_ID, length=4, action_hex=code)
+        """Send verification code to the device.
+
+        Always waits the full settle delay after the write (the firmware needs
+        it before the next command, notably the CCCD write in
+        FeederDevice.connect(), where notifications are still off and no reply
+        can arrive).  Returns the 06 reply if one arrived meanwhile, else None.
+        """
+        command = self.encode_command(
+            CMD_SET_FAMILY_ID, length=4, action=self.hex_string_to_bytes(code)
+        )
+        future = self.expect_notification(CMD_SET_FAMILY_ID)
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
+            await self.send_frame(command)
+            await asyncio.sleep(_VERIFICATION_SETTLE_DELAY)
             _LOGGER.debug("[%s] Verification code sent", self.device_address)
-            await asyncio.sleep(2)
+            return future.result() if future.done() and not future.cancelled() else None
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to send verification code: %s",
                 self.device_address,
                 exc,
             )
+        finally:
+            future.cancel()
+
+    async def query_name_version(self, timeout: float = 1.5) -> Optional[dict]:
+        """Query device name and firmware version (response via notification, command 00).
 
-    async def query_name_version(self):
-        """Query device name and firmware version (response via notification, command 00)."""
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_QUERY_NAME_VERSION, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_QUERY_NAME_VERSION]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1.5)
+            return await self._request(command, timeout)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to query name/version: %s",
@@ -771,24 +1141,16 @@ class FeederBLEProtocol:
             return
         if dt is None:
             dt = datetime.now()
-        # 6 bytes: year%100, month, day, hour, minute, second
-        action_bytes = bytes(
-            [
-                dt.year % 100,
-                dt.month,
-                dt.day,
-                dt.hour,
-                dt.minute,
-                dt.second,
-            ]
-        )
         command = self.encode_command(
-            CMD_SYNC_TIME, length=6, action_hex=action_bytes.hex().upper()
+            CMD_SYNC_TIME,
+            action=_SYNC_TIME_STRUCT.pack(
+                dt.year % 100, dt.month, dt.day, dt.hour, dt.minute, dt.second
+            ),
         )
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
+            reply = await self._request(command, 1.0)
             _LOGGER.debug("[%s] Time synced to %s", self.device_address, dt)
-            await asyncio.sleep(1)
+            return reply
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to sync time: %s",
@@ -796,14 +1158,16 @@ class FeederBLEProtocol:
                 exc,
             )
 
-    async def query_fault(self):
-        """Query fault status"""
+    async def query_fault(self, timeout: float = 1.0) -> Optional[dict]:
+        """Query fault status.
+
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_FAULT, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_FAULT]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1)
+            return await self._request(command, timeout)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to query fault status: %s",
@@ -811,14 +1175,16 @@ class FeederBLEProtocol:
                 exc,
             )
 
-    async def query_child_lock(self):
-        """Query child lock status"""
+    async def query_child_lock(self, timeout: float = 1.0) -> Optional[dict]:
+        """Query child lock status.
+
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_CHILD_LOCK, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_CHILD_LOCK]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1)
+            return await self._request(command, timeout)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to query child lock: %s",
@@ -826,14 +1192,16 @@ class FeederBLEProtocol:
                 exc,
             )
 
-    async def query_reminder_tone(self):
-        """Query prompt sound / reminder tone status"""
+    async def query_reminder_tone(self, timeout: float = 1.0) -> Optional[dict]:
+        """Query prompt sound / reminder tone status.
+
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_REMINDER_TONE, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_REMINDER_TONE]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1)
+            return await self._request(command, timeout)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to query reminder tone: %s",
@@ -841,14 +1209,16 @@ class FeederBLEProtocol:
                 exc,
             )
 
-    async def query_feeding_status(self):
-        """Query feeding status"""
+    async def query_feeding_status(self, timeout: float = 1.0) -> Optional[dict]:
+        """Query feeding status.
+
+        Returns the decoded reply, or None if none arrived within ``timeout`` seconds.
+        """
         if not await self._ensure_connected():
-            return
-        command = self.encode_command(CMD_FEEDING_STATUS, length=0)
+            return None
+        command = _STATIC_FRAMES[CMD_FEEDING_STATUS]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
-            await asyncio.sleep(1)
+            return await self._request(command, timeout)
         except Exception as exc:
             _LOGGER.warning(
                 "[%s] Failed to query feeding status: %s",
@@ -856,6 +1226,59 @@ class FeederBLEProtocol:
                 exc,
             )
 
+    async def query_batch(
+        self, commands: Iterable[int], timeout: float = 2.0
+    ) -> Dict[int, Optional[dict]]:
+        """Send several payload-less queries back-to-back and collect the replies.
+
+        All the frames are written without response before any reply is
+        awaited, so the whole batch costs about one round-trip rather than one
+        fixed delay per query.  Returns ``{command byte: decoded notification}``;
+        commands that got no reply within ``timeout`` map to None.  Repeated
+        commands are sent once.
+
+        Raises:
+            ValueError: If a command has no payload-less query frame.
+        """
+        # One waiter and one write per distinct command, in first-seen order
+        commands = tuple(dict.fromkeys(_command_byte(command) for command in commands))
+        unsupported = [command for command in commands if command not in _STATIC_FRAMES]
+        if unsupported:
+            raise ValueError(
+                "Not payload-less queries: "
+                + ", ".join(f"{command:02X}" for command in unsupported)
+            )
+        results: Dict[int, Optional[dict]] = dict.fromkeys(commands)
+        if not await self._ensure_connected():
+            return results
+        waiters = {command: self.expect_notification(command) for command in commands}
+        try:
+            for command in commands:
+                await self.send_frame(_STATIC_FRAMES[command])
+            replies = await asyncio.gather(
+                *(self.wait_for_notification(f, timeout) for f in waiters.values())
+            )
+            results.update(zip(waiters, replies))
+        except Exception as exc:
+            _LOGGER.warning(
+                "[%s] Failed to query %s: %s",
+                self.device_address,
+                ", ".join(f"{command:02X}" for command in commands),
+                exc,
+            )
+        finally:
+            for future in waiters.values():
+                future.cancel()
+        return results
+
+    async def query_all(self, timeout: float = 2.0) -> Dict[int, Optional[dict]]:
+        """Query name/version, fault, child lock, prompt sound and feeding status at once.
+
+        Thin wrapper around query_batch(): the five queries share one response
+        window instead of running one after another.
+        """
+        return await self.query_batch(_STATE_QUERIES, timeout)
+
     async def send_heartbeat(self) -> bool:
         """Send a heartbeat packet (CMD_HEARTBEAT, no payload) to keep the BLE link alive.
 
@@ -865,11 +1288,11 @@ class FeederBLEProtocol:
 
         Returns True if the write succeeded, False otherwise (connection lost).
         """
-        if not self.client or not self.client.is_connected:
+        if not self.is_connected:
             return False
-        command = self.encode_command(CMD_HEARTBEAT, length=0)
+        command = _STATIC_FRAMES[CMD_HEARTBEAT]
         try:
-            await self.client.write_gatt_char(self.write_uuid, command, response=False)
+            await self.send_frame(command)
             _LOGGER.debug("[%s] Heartbeat sent", self.device_address)
             return True
         except Exception as exc:
@@ -884,7 +1307,7 @@ class FeederBLEProtocol:
         just report the drop and let the higher-level code reconnect via
         the factory (which includes verification, adapter selection, etc.).
         """
-        if self.client and self.client.is_connected:
+        if self.is_connected:
             return True
 
         if self._managed_connection:
@@ -0,0 +1,90 @@
+"""
+Feed schedule model for Petnetizen feeders.
+
+Pure Python (no BLE dependency) so schedules can be built and serialized
+without importing bleak.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import Tuple
+
+# Weekday bitmask values (from FeedInfo.Companion.getWeekValue)
+WEEKDAY_BITMASK = {
+    "sun": 1,
+    "mon": 2,
+    "tue": 4,
+    "wed": 8,
+    "thu": 16,
+    "fri": 32,
+    "sat": 64,
+}
+
+# One schedule slot on the wire: week bitmask, hour, minute, portions, enabled
+_SLOT_STRUCT = struct.Struct("5B")
+
+
+class Weekday:
+    """Weekday constants for schedule"""
+
+    SUNDAY = "sun"
+    MONDAY = "mon"
+    TUESDAY = "tue"
+    WEDNESDAY = "wed"
+    THURSDAY = "thu"
+    FRIDAY = "fri"
+    SATURDAY = "sat"
+
+    ALL_DAYS = ["sun", "mon", "tue", "wed", "thu", "fri", "sat"]
+    WEEKDAYS = ["mon", "tue", "wed", "thu", "fri"]
+    WEEKEND = ["sat", "sun"]
+
+
+@dataclass(slots=True, frozen=True)
+class FeedSchedule:
+    """Represents a single feed schedule entry
+
+    Args:
+        weekdays: Weekday names (e.g., ["mon", "wed", "fri"]); stored as a tuple
+        time: Time in HH:MM format (e.g., "08:00")
+        portions: Number of portions to feed (1-15)
+        enabled: Whether this schedule is enabled
+
+    Raises:
+        ValueError: If ``time`` is not HH:MM with a valid hour and minute, or
+            ``portions`` does not fit the slot's single byte (0-255).
+    """
+
+    weekdays: Tuple[str, ...]
+    time: str
+    portions: int
+    enabled: bool = True
+    _packed: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the wire encoding can be computed once and reused on
+        # every set_schedule() call.
+        weekdays = tuple(self.weekdays)
+        week_value = 0
+        get_bit = WEEKDAY_BITMASK.get
+        for day in weekdays:
+            # Names are normally already lower-case; only fold when they aren't
+            week_value |= get_bit(day) or get_bit(day.lower(), 0)
+        hour, minute = map(int, self.time.split(":"))
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError(f"Invalid schedule time {self.time!r}; expected HH:MM")
+        if not 0 <= self.portions <= 255:
+            raise ValueError(f"Schedule portions {self.portions} out of range 0-255")
+        object.__setattr__(self, "weekdays", weekdays)
+        object.__setattr__(
+            self,
+            "_packed",
+            _SLOT_STRUCT.pack(
+                week_value, hour, minute, self.portions, 1 if self.enabled else 0
+            ),
+        )
+
+    def to_bytes(self) -> bytes:
+        """Convert schedule to protocol format"""
+        # Format: week(1 hex) + hour(1 hex) + minute(1 hex) + count(1 hex) + enabled(1 hex)
+        return self._packed
@@ -0,0 +1,99 @@
+"""FeederDevice command flows against a fake BLE client (no hardware)."""
+
+import asyncio
+
+from petnetizen_feeder import FeederDevice
+
+
+class FakeClient:
+    """Minimal BleakClient stand-in that answers writes with canned notifications."""
+
+    is_connected = True
+
+    def __init__(self, protocol, responses):
+        self._protocol = protocol
+        self._responses = responses  # command byte -> list of notification frames
+        self.writes = []
+
+    async def write_gatt_char(self, char, data, response=False):
+        self.writes.append(bytes(data))
+        loop = asyncio.get_running_loop()
+        for frame in self._responses.get(data[1], []):
+            loop.call_soon(self._protocol.notification_handler, None, bytearray(frame))
+
+
+def _connected_feeder(responses) -> tuple[FeederDevice, FakeClient]:
+    feeder = FeederDevice("AA:BB:CC:DD:EE:FF")
+    client = FakeClient(feeder._protocol, responses)
+    feeder._protocol.client = client
+    feeder._connected = True
+    return feeder, client
+
+
+async def test_feed_returns_on_completion_record():
+    """feed() returns True as soon as the 0C feed-result notification arrives."""
+    feeder, client = _connected_feeder(
+        {
+            0x08: [
+                bytes.fromhex("EA080101 00AE"),
+                bytes.fromhex("EA0C09 180501080000 020100 00AE"),
+            ]
+        }
+    )
+    assert await asyncio.wait_for(feeder.feed(portions=2), 1.0) is True
+    assert client.writes == [bytes.fromhex("EA080102 00AE")]
+    assert feeder.get_last_feed_result()["portions"] == 2
+
+
+async def test_query_schedule_parses_slots():
+    """query_schedule() returns the decoded slots from the 0x11 response."""
+    feeder, _ = _connected_feeder(
+        {0x11: [bytes.fromhex("EA110B 02 7F08000101 03121E0200 00AE")]}
+    )
+    slots = await asyncio.wait_for(feeder.query_schedule(), 1.0)
+    assert slots == [
+        {
+            "weekdays": ["sun", "mon", "tue", "wed", "thu", "fri", "sat"],
+            "time": "08:00",
+            "portions": 1,
+            "enabled": True,
+        },
+        {"weekdays": ["sun", "mon"], "time": "18:30", "portions": 2, "enabled": False},
+    ]
+
+
+async def test_feed_pre_queries_are_pipelined():
+    """feed(fast=False) writes all pre-queries before waiting on any reply."""
+    feeder, client = _connected_feeder(
+        {
+            0x0A: [bytes.fromhex("EA0A0100 00AE")],
+            0x0D: [bytes.fromhex("EA0D0100 00AE")],
+            0x09: [bytes.fromhex("EA090100 00AE")],
+            0x08: [bytes.fromhex("EA0C09 180501080000 010100 00AE")],
+        }
+    )
+    assert await asyncio.wait_for(feeder.feed(portions=1, fast=False), 0.5) is True
+    assert [w[1] for w in client.writes] == [0x0A, 0x0D, 0x09, 0x08]
+
+
+async def test_state_query_returns_on_reply():
+    """get_child_lock_status() returns as soon as the 0D reply arrives."""
+    feeder, _ = _connected_feeder({0x0D: [bytes.fromhex("EA0D0101 00AE")]})
+    assert await asyncio.wait_for(feeder.get_child_lock_status(), 0.5) is True
+
+
+async def test_query_all_collects_every_state_reply():
+    """query_all() pipelines the state queries and maps each command to its reply."""
+    feeder, client = _connected_feeder(
+        {
+            0x0A: [bytes.fromhex("EA0A0100 00AE")],
+            0x0D: [bytes.fromhex("EA0D0101 00AE")],
+            0x12: [bytes.fromhex("EA120100 00AE")],
+            0x09: [bytes.fromhex("EA090101 00AE")],
+        }
+    )
+    replies = await asyncio.wait_for(feeder._protocol.query_all(timeout=0.2), 1.0)
+    assert [w[1] for w in client.writes] == [0x00, 0x0A, 0x0D, 0x12, 0x09]
+    assert replies[0x00] is None  # no canned name/version reply
+    assert replies[0x0D]["child_lock_text"] == "LOCKED"
+    assert replies[0x09]["feeding_status_text"] == "Feeding"
@@ -29,3 +29,16 @@ def test_feed_schedule_to_bytes():
     assert raw[2] == 0
     assert raw[3] == 1
     assert raw[4] == 1
+
+
+def test_schedule_helpers_do_not_import_bleak():
+    """Weekday/FeedSchedule are usable without loading the BLE stack."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, petnetizen_feeder as p; "
+        "p.FeedSchedule(p.Weekday.WEEKEND, '09:30', 2).to_bytes(); "
+        "assert 'bleak' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,198 @@
+"""Tests for the low-level protocol codec and notification routing (no BLE hardware)."""
+
+import asyncio
+import time
+
+import pytest
+
+from petnetizen_feeder import protocol
+
+from petnetizen_feeder.protocol import (
+    CMD_FAULT,
+    CMD_SET_FEEDER_PLAN,
+    RECEIVED_DATA_MAXLEN,
+    FeederBLEProtocol,
+    FeederFrame,
+    enable_eager_tasks,
+)
+
+
+def _frame(command: int, payload: bytes = b"") -> bytearray:
+    return bytearray([0xEA, command, len(payload)]) + payload + bytearray([0x00, 0xAE])
+
+
+def test_encode_command_bytes_and_hex_payloads_match():
+    """Raw-bytes and hex-string payloads produce the same frame."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    frame = p.encode_command("07", action=b"\x7f\x08\x00\x01\x01")
+    assert frame == p.encode_command("07", action_hex="7F08000101")
+    assert frame == p.encode_command(
+        CMD_SET_FEEDER_PLAN, action=b"\x7f\x08\x00\x01\x01"
+    )
+    assert frame == bytes.fromhex("EA07057F0800010100AE")
+    assert p.encode_command("11", length=0) == bytes.fromhex("EA110000AE")
+
+
+async def test_expect_notification_resolved_by_handler():
+    """A pending future is resolved with the decoded notification for its command."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    future = p.expect_notification("0D")
+    p.notification_handler(None, _frame(0x0A, b"\x00"))
+    assert not future.done()
+    p.notification_handler(None, _frame(0x0D, b"\x01"))
+    decoded = await p.wait_for_notification(future, 1.0)
+    assert decoded["child_lock"] == 1
+
+
+async def test_wait_for_notification_timeout_discards_waiter():
+    """A timed-out wait returns None and leaves no stale waiter behind."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    future = p.expect_notification("17", "18")
+    assert await p.wait_for_notification(future, 0.01) is None
+    assert p._pending == {}
+
+
+def test_received_data_is_bounded():
+    """The notification buffer keeps only the most recent frames."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    for i in range(RECEIVED_DATA_MAXLEN + 10):
+        p.notification_handler(None, _frame(0x09, bytes((i % 3,))))
+    assert len(p.received_data) == RECEIVED_DATA_MAXLEN
+
+
+def test_decode_feed_records_ignores_trailing_partial_record():
+    """0x0C payloads decode whole 9-byte records; unknown codes keep their value."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    payload = bytes([24, 5, 1, 8, 0, 0, 2, 1, 0, 24, 5, 1, 18, 30, 5, 1, 2, 7, 0xFF])
+    records = p.decode_notification(_frame(0x0C, payload))["feed_records"]
+    assert records == [
+        {
+            "timestamp": "2024-05-01 08:00:00",
+            "portions": 2,
+            "feed_type": "Manual",
+            "status": "Success",
+        },
+        {
+            "timestamp": "2024-05-01 18:30:05",
+            "portions": 1,
+            "feed_type": "Plan",
+            "status": "Unknown(7)",
+        },
+    ]
+
+
+async def test_enable_eager_tasks_sets_factory_on_running_loop():
+    """enable_eager_tasks() installs asyncio's eager task factory on the running loop."""
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    try:
+        enable_eager_tasks()
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+    finally:
+        loop.set_task_factory(previous)
+
+
+def test_received_data_snapshots_notification_bytes():
+    """Buffered frames are immutable copies, unaffected by reuse of bleak's buffer."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    buffer = _frame(0x0A, b"\x00")
+    p.notification_handler(None, buffer)
+    buffer[3] = 0x05
+    assert p.received_data[-1] == bytes(_frame(0x0A, b"\x00"))
+    assert isinstance(p.received_data[-1], bytes)
+
+
+def test_feeder_frame_round_trips_and_matches_decode_notification():
+    """FeederFrame splits a frame into fields and to_dict() is the decoded dict."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    data = bytes(_frame(0x0D, b"\x01"))
+    frame = FeederFrame.from_bytes(data)
+    assert (frame.command, frame.length, frame.payload) == (0x0D, 1, b"\x01")
+    assert frame.command_name == "CHILD_LOCK"
+    assert frame.to_bytes() == data
+    assert frame.fields() == {"child_lock": 1, "child_lock_text": "LOCKED"}
+    assert frame.to_dict() == p.decode_notification(data)
+    assert p.decode_notification(data)["raw_bytes"] is data
+
+
+async def test_send_frame_never_fragments_long_frames(caplog):
+    """A frame longer than max_write_size is written whole, with a warning."""
+
+    class RecordingClient:
+        def __init__(self):
+            self.writes = []
+
+        async def write_gatt_char(self, char, data, response=False):
+            self.writes.append(bytes(data))
+
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    p.client = RecordingClient()
+    frame = p.encode_command(CMD_SET_FEEDER_PLAN, action=bytes(range(40)))
+    await p.send_frame(frame)
+    assert p.client.writes == [frame]
+    assert "exceeds the 20-byte write limit" in caplog.text
+
+
+async def test_ensure_connected_does_not_cycle_notifications():
+    """A live link is reported without any GATT traffic (no stop/start_notify)."""
+
+    class LiveClient:
+        is_connected = True
+
+        async def stop_notify(self, char):
+            raise AssertionError("stop_notify called")
+
+        async def start_notify(self, char, callback):
+            raise AssertionError("start_notify called")
+
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    p.client = LiveClient()
+    assert await p._ensure_connected() is True
+
+
+class _LiveRecordingClient:
+    is_connected = True
+
+    def __init__(self):
+        self.writes = []
+
+    async def write_gatt_char(self, char, data, response=False):
+        self.writes.append(bytes(data))
+
+
+async def test_query_batch_rejects_commands_without_static_frame():
+    """A command that needs a payload is a caller error, not a silent None."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    p.client = _LiveRecordingClient()
+    with pytest.raises(ValueError, match="07"):
+        await p.query_batch((CMD_FAULT, CMD_SET_FEEDER_PLAN))
+    assert p.client.writes == []
+    assert not p._pending
+
+
+async def test_query_batch_sends_duplicate_commands_once():
+    """Repeated commands share one write and one waiter, and nothing is leaked."""
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+    p.client = _LiveRecordingClient()
+    results = await p.query_batch((CMD_FAULT, "0A", CMD_FAULT), timeout=0.01)
+    assert results == {CMD_FAULT: None}
+    assert p.client.writes == [bytes.fromhex("EA0A0000AE")]
+    assert not p._pending
+
+
+async def test_verification_code_keeps_settle_delay_when_reply_arrives(monkeypatch):
+    """An immediate 06 reply does not cut the post-verification settle time short."""
+    monkeypatch.setattr(protocol, "_VERIFICATION_SETTLE_DELAY", 0.05)
+    p = FeederBLEProtocol("AA:BB:CC:DD:EE:FF")
+
+    class EchoClient(_LiveRecordingClient):
+        async def write_gatt_char(self, char, data, response=False):
+            await super().write_gatt_char(char, data, response)
+            p.notification_handler(None, _frame(data[1], b"\x01"))
+
+    p.client = EchoClient()
+    start = time.monotonic()
+    reply = await p.send_verification_code()
+    assert time.monotonic() - start >= 0.05
+    assert reply["command"] == "06"
+    assert not p._pending
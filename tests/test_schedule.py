@@ -0,0 +1,21 @@
+"""Tests for the FeedSchedule model (no BLE dependency)."""
+
+import pytest
+
+from petnetizen_feeder.schedule import FeedSchedule
+
+
+def test_to_bytes_packs_slot():
+    """A schedule packs to week bitmask, hour, minute, portions, enabled."""
+    schedule = FeedSchedule(["mon", "WED"], "08:30", 2)
+    assert schedule.to_bytes() == bytes((0x0A, 8, 30, 2, 1))
+
+
+@pytest.mark.parametrize(
+    ("time", "portions"),
+    [("24:00", 1), ("08:60", 1), ("-1:00", 1), ("08:00", 256), ("08:00", -1)],
+)
+def test_out_of_range_fields_raise_value_error(time, portions):
+    """Out-of-range time or portions is reported as ValueError, not struct.error."""
+    with pytest.raises(ValueError):
+        FeedSchedule(["mon"], time, portions)